@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.event import async_track_time_interval
 from datetime import timedelta
@@ -10,25 +10,42 @@ from .const import DOMAIN, PLATFORMS
 from .hub import MatisHub
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    hub = MatisHub(hass, entry.data)
-    await hub.async_discover()  # initial discovery
-    await hub.async_first_poll()
+    hub = MatisHub(hass, {**entry.data, **entry.options})
+    try:
+        await hub.async_discover(first=True)  # initial discovery
+        for coordinator in hub.coordinators.values():
+            await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # setup will be retried with a new hub; release this one's socket now
+        hub.close()
+        raise
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = hub
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # background: periodic rediscovery (every 30 minutes)
+    @callback
     def _schedule_rediscover(now):
         hass.async_create_task(hub.async_discover())
 
-    async_track_time_interval(hass, _schedule_rediscover, timedelta(minutes=30))
+    entry.async_on_unload(
+        async_track_time_interval(hass, _schedule_rediscover, timedelta(minutes=30))
+    )
+
+    # options changes (concurrency, scan intervals) apply on reload
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     # periodic polling already handled inside platforms via coordinator in hub
     return True
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        hub = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if hub is not None:
+            hub.close()
     return unload_ok
\ No newline at end of file
@@ -3,11 +3,22 @@ from __future__ import annotations
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST
-from .const import DOMAIN, CONF_READ_COMMUNITY, CONF_WRITE_COMMUNITY
+from homeassistant.core import callback
+from .const import (
+    DOMAIN, CONF_READ_COMMUNITY, CONF_WRITE_COMMUNITY,
+    CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY,
+    CONF_SCAN_INTERVAL_FAST, CONF_SCAN_INTERVAL_SLOW,
+    DEFAULT_SCAN_INTERVAL_FAST, DEFAULT_SCAN_INTERVAL_SLOW,
+)
 
 class SnmpMatisConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        return SnmpMatisOptionsFlow()
+
     async def async_step_user(self, user_input=None):
         errors = {}
         if user_input is not None:
@@ -23,4 +34,26 @@ class SnmpMatisConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             vol.Optional(CONF_READ_COMMUNITY, default="public"): str,
             vol.Optional(CONF_WRITE_COMMUNITY, default="private"): str,
         })
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
\ No newline at end of file
+        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
+
+class SnmpMatisOptionsFlow(config_entries.OptionsFlow):
+    async def async_step_init(self, user_input=None):
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        schema = vol.Schema({
+            vol.Optional(
+                CONF_MAX_CONCURRENCY,
+                default=options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
+            vol.Optional(
+                CONF_SCAN_INTERVAL_FAST,
+                default=options.get(CONF_SCAN_INTERVAL_FAST, DEFAULT_SCAN_INTERVAL_FAST),
+            ): vol.All(vol.Coerce(int), vol.Range(min=2, max=60)),
+            vol.Optional(
+                CONF_SCAN_INTERVAL_SLOW,
+                default=options.get(CONF_SCAN_INTERVAL_SLOW, DEFAULT_SCAN_INTERVAL_SLOW),
+            ): vol.All(vol.Coerce(int), vol.Range(min=30, max=600)),
+        })
+        return self.async_show_form(step_id="init", data_schema=schema)
\ No newline at end of file
@@ -2,5 +2,12 @@ DOMAIN = "snmp_matis_gateway"
 
 CONF_READ_COMMUNITY = "read_community"
 CONF_WRITE_COMMUNITY = "write_community"
+CONF_MAX_CONCURRENCY = "max_concurrency"
+CONF_SCAN_INTERVAL_FAST = "scan_interval_fast"
+CONF_SCAN_INTERVAL_SLOW = "scan_interval_slow"
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_SCAN_INTERVAL_FAST = 5
+DEFAULT_SCAN_INTERVAL_SLOW = 60
 
 PLATFORMS = ["sensor", "switch"]
\ No newline at end of file
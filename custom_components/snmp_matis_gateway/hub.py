@@ -1,54 +1,71 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, List, Any, Callable, Optional
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+import functools
+import logging
+import math
+import time
+from typing import Dict, List, Any, Callable, Optional, Tuple
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from datetime import timedelta
 
-from pysnmp.hlapi import (
-    SnmpEngine, CommunityData, UdpTransportTarget, ContextData,
-    ObjectType, ObjectIdentity, getCmd
+import numpy as np
+
+# SNMPv2c only: v1arch skips the SNMPv3 USM/VACM machinery of v3arch
+from pysnmp.hlapi.v1arch.asyncio import (
+    SnmpDispatcher, CommunityData, UdpTransportTarget,
+    get_cmd, set_cmd, bulk_cmd
+)
+from pysnmp.proto.rfc1902 import Integer, ObjectName
+from pyasn1.type.univ import Null
+from pysnmp.proto.rfc1905 import NoSuchObject, NoSuchInstance, EndOfMibView
+
+from .const import (
+    DOMAIN, CONF_READ_COMMUNITY, CONF_WRITE_COMMUNITY,
+    CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY,
+    CONF_SCAN_INTERVAL_FAST, CONF_SCAN_INTERVAL_SLOW,
+    DEFAULT_SCAN_INTERVAL_FAST, DEFAULT_SCAN_INTERVAL_SLOW,
 )
 
-from .const import DOMAIN, CONF_READ_COMMUNITY, CONF_WRITE_COMMUNITY
-
-def _snmp_get(ip: str, community: str, oid: str) -> Optional[str]:
-    iterator = getCmd(
-        SnmpEngine(),
-        CommunityData(community),
-        UdpTransportTarget((ip, 161), timeout=1.0, retries=1),
-        ContextData(),
-        ObjectType(ObjectIdentity(oid))
-    )
-    errorIndication, errorStatus, errorIndex, varBinds = next(iterator)
-    if errorIndication or errorStatus:
+_LOGGER = logging.getLogger(__name__)
+
+# battery cell table, polled column by column with GETBULK
+CELL_TABLE = ".1.3.6.1.4.1.45797.14.9.5.1."
+CELL_MAX = 32
+
+# hard cap on one PDU round-trip (transport is 1 s x 2 attempts), so a lost
+# request can never hold a semaphore permit or a poll forever
+REQUEST_TIMEOUT = 5
+
+# energy totals only move in 0.01 kWh steps, so they are re-read at most this
+# often however short the slow scan interval is; everything else follows its tier
+ENERGY_TTL = 300
+
+# polling tiers: fast for power/voltage/current/switch state, slow for energy/SOC/temperature
+TIER_FAST = "fast"
+TIER_SLOW = "slow"
+
+class MatisValues:
+    # read-only view of the transformed values by unique_id; NaN (no reading) reads as None
+    __slots__ = ("_slots", "_buffer")
+
+    def __init__(self, slots: Dict[str, int], buffer: np.ndarray) -> None:
+        self._slots = slots
+        self._buffer = buffer
+
+    def get(self, unique_id: str, default: Any = None) -> Any:
+        i = self._slots.get(unique_id)
+        if i is None:
+            return default
+        v = self._buffer[i]
+        return default if math.isnan(v) else float(v)
+
+def _raw(value: Any) -> Optional[str]:
+    # noSuchObject / noSuchInstance / endOfMibView mean the OID is absent
+    if isinstance(value, (NoSuchObject, NoSuchInstance, EndOfMibView)):
         return None
-    for vb in varBinds:
-        return str(vb[1])
-    return None
-
-def _snmp_set(ip: str, community: str, oid: str, value: int) -> bool:
-    # lazy import to avoid cost if not needed
-    from pysnmp.hlapi import setCmd, Integer
-    iterator = setCmd(
-        SnmpEngine(),
-        CommunityData(community),
-        UdpTransportTarget((ip, 161), timeout=1.0, retries=1),
-        ContextData(),
-        ObjectType(ObjectIdentity(oid), Integer(int(value)))
-    )
-    errorIndication, errorStatus, errorIndex, varBinds = next(iterator)
-    return not (errorIndication or errorStatus)
-
-TRANSFORMS: Dict[str, Callable[[Optional[str]], Optional[float]]] = {
-    "raw_int": lambda v: float(v) if v is not None else None,
-    "div100": lambda v: (float(v)/100.0) if v is not None else None,
-    "div1000": lambda v: (float(v)/1000.0) if v is not None else None,
-    "div10": lambda v: (float(v)/10.0) if v is not None else None,
-    "kW_div100_to_W": lambda v: (float(v)/100.0*1000.0) if v is not None else None,
-    "kW_div1000_to_W": lambda v: (float(v)/1000.0*1000.0) if v is not None else None,
-}
+    return str(value)
 
 class MatisHub:
     def __init__(self, hass: HomeAssistant, cfg: Dict[str, Any]) -> None:
@@ -59,95 +76,262 @@ class MatisHub:
 
         self.sensors: List[Dict[str, Any]] = []
         self.switches: List[Dict[str, Any]] = []
+        self._sensor_ids: set[str] = set()
+        self._switch_ids: set[str] = set()
+
+        # descriptors added since the platforms last took them
+        self._pending_new_sensors: List[Dict[str, Any]] = []
+        self._pending_new_switches: List[Dict[str, Any]] = []
+
+        # set by the platforms; called with each batch of pending descriptors
+        self._new_sensor_cb: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+        self._new_switch_cb: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+
+        # one coordinator per polling tier; sensors subscribe to their tier's
+        intervals = {
+            TIER_FAST: cfg.get(CONF_SCAN_INTERVAL_FAST, DEFAULT_SCAN_INTERVAL_FAST),
+            TIER_SLOW: cfg.get(CONF_SCAN_INTERVAL_SLOW, DEFAULT_SCAN_INTERVAL_SLOW),
+        }
+        self.coordinators: Dict[str, DataUpdateCoordinator] = {
+            tier: DataUpdateCoordinator(
+                hass,
+                logger=_LOGGER,
+                name=f"matis_snmp_{tier}",
+                update_method=functools.partial(self._async_poll, tier),
+                update_interval=timedelta(seconds=int(interval)),
+            )
+            for tier, interval in intervals.items()
+        }
+        # switches and diagnostics follow the fast tier
+        self.coordinator = self.coordinators[TIER_FAST]
 
-        # coordinator to poll all sensor oids
-        self.coordinator = DataUpdateCoordinator(
-            hass,
-            logger=hass.logger,
-            name="matis_snmp",
-            update_method=self._async_poll_all,
-            update_interval=timedelta(seconds=5),
+        # OIDs with a ttl are only re-read once it expires; the rest every tier poll
+        self._last_fetch: Dict[str, float] = {}
+        self._cache_hits = 0
+        self._cache_lookups = 0
+
+        # OIDs that stop answering are backed off exponentially (capped at 300 s)
+        self._fail_counts: Dict[str, int] = {}
+        self._next_try: Dict[str, float] = {}
+
+        # long-lived SNMP dispatcher, reused by every GET/SET until unload
+        self._dispatcher = SnmpDispatcher()
+        self._auth_read = CommunityData(self.read_com, mpModel=1)
+        self._auth_write = CommunityData(self.write_com, mpModel=1)
+        self._transport: Optional[UdpTransportTarget] = None
+
+        # poll plan, rebuilt after each discovery. self.sensors keeps the full
+        # descriptors for entity setup; the poll only touches these flat slot tables
+        self._oid_slots: Dict[str, List[int]] = {}
+        self._uids: Tuple[str, ...] = ()
+        self._uid_slot: Dict[str, int] = {}
+        self._scales = np.empty(0)
+        self._raw_buffer = np.empty(0)
+        self._out_buffer = np.empty(0)
+        self._oid_ttl: Dict[str, Dict[str, float]] = {TIER_FAST: {}, TIER_SLOW: {}}
+        self._varbinds: Dict[str, Tuple[ObjectName, Null]] = {}
+        self._scalar_oids: List[str] = []
+        # cell column -> highest discovered row index, used as GETBULK max-repetitions
+        self._cell_columns: Dict[str, int] = {}
+
+        # caps in-flight GET/GETBULK/SET PDUs so the gateway does not drop UDP
+        self._request_sem = asyncio.Semaphore(
+            int(cfg.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY))
         )
 
-        # cache values
-        self._values: Dict[str, Any] = {}
+    async def _get_transport(self) -> UdpTransportTarget:
+        if self._transport is None:
+            self._transport = await UdpTransportTarget.create((self.host, 161), timeout=1, retries=1)
+        return self._transport
+
+    def _varbind(self, oid: str) -> Tuple[ObjectName, Null]:
+        # plain (ObjectName, Null) pairs, never ObjectType: any ObjectType makes
+        # pysnmp force lookupMib=True and resolve every response varbind.
+        # Prepared at discovery time; ad-hoc probes build their own
+        varbind = self._varbinds.get(oid)
+        if varbind is None:
+            varbind = (ObjectName(oid), Null())
+        return varbind
+
+    async def _snmp_get(self, oid: str) -> Optional[str]:
+        return ((await self._snmp_get_many([oid])) or {}).get(oid)
+
+    async def _snmp_get_many(self, oids: List[str]) -> Optional[Dict[str, Optional[str]]]:
+        # single GET PDU carrying one varbind per OID; None if no response arrived.
+        # A varbind the agent rejects via errorIndex reads as None and the GET is
+        # re-issued without it, so one bad OID does not sink the rest
+        oids = list(oids)
+        out: Dict[str, Optional[str]] = {}
+        while oids:
+            async with self._request_sem:
+                try:
+                    async with asyncio.timeout(REQUEST_TIMEOUT):
+                        errorIndication, errorStatus, errorIndex, varBinds = await get_cmd(
+                            self._dispatcher,
+                            self._auth_read,
+                            await self._get_transport(),
+                            *[self._varbind(o) for o in oids],
+                            lookupMib=False
+                        )
+                except TimeoutError:
+                    return None
+            if errorIndication:
+                return None
+            if not errorStatus:
+                out.update((f".{name}", _raw(val)) for name, val in varBinds)
+                break
+            index = int(errorIndex)
+            if not 0 < index <= len(oids):
+                return None  # error not tied to a varbind: no better than a lost PDU
+            out[oids.pop(index - 1)] = None
+        return out
+
+    async def _snmp_bulk(self, column: str, max_repetitions: int = CELL_MAX) -> Optional[Dict[str, Optional[str]]]:
+        # GETBULK down one table column; stop at the first OID past it.
+        # None if no response arrived
+        async with self._request_sem:
+            try:
+                async with asyncio.timeout(REQUEST_TIMEOUT):
+                    errorIndication, errorStatus, errorIndex, varBinds = await bulk_cmd(
+                        self._dispatcher,
+                        self._auth_read,
+                        await self._get_transport(),
+                        0, max_repetitions,
+                        self._varbind(column),
+                        lookupMib=False
+                    )
+            except TimeoutError:
+                return None
+        # an errorStatus names no row we could drop, so it counts as no answer
+        if errorIndication or errorStatus:
+            return None
+        prefix = f"{column}."
+        out: Dict[str, Optional[str]] = {}
+        for name, val in varBinds:
+            oid = f".{name}"
+            if not oid.startswith(prefix):
+                break
+            out[oid] = _raw(val)
+        return out
+
+    async def _snmp_set(self, oid: str, value: int) -> bool:
+        # same permit and time cap as the reads; False if no response arrived
+        async with self._request_sem:
+            try:
+                async with asyncio.timeout(REQUEST_TIMEOUT):
+                    errorIndication, errorStatus, errorIndex, varBinds = await set_cmd(
+                        self._dispatcher,
+                        self._auth_write,
+                        await self._get_transport(),
+                        (ObjectName(oid), Integer(int(value)))
+                    )
+            except TimeoutError:
+                return False
+        return not (errorIndication or errorStatus)
+
+    @callback
+    def set_new_sensor_callback(self, cb: Callable[[List[Dict[str, Any]]], None]) -> None:
+        self._new_sensor_cb = cb
+        self._flush_pending()
+
+    @callback
+    def set_new_switch_callback(self, cb: Callable[[List[Dict[str, Any]]], None]) -> None:
+        self._new_switch_cb = cb
+        self._flush_pending()
+
+    @callback
+    def _flush_pending(self) -> None:
+        # hand each platform only the descriptors it has not seen yet
+        if self._pending_new_sensors and self._new_sensor_cb is not None:
+            pending, self._pending_new_sensors = self._pending_new_sensors, []
+            self._new_sensor_cb(pending)
+        if self._pending_new_switches and self._new_switch_cb is not None:
+            pending, self._pending_new_switches = self._pending_new_switches, []
+            self._new_switch_cb(pending)
+
+    def close(self) -> None:
+        # unregister callbacks, end pending requests and close the UDP socket
+        self._dispatcher.close()
 
-    async def async_first_poll(self):
-        await self.coordinator.async_config_entry_first_refresh()
+    async def _probe(self, oids: List[str]) -> Dict[str, Optional[str]]:
+        # concurrent single-OID GETs, bounded by the request semaphore
+        values = await asyncio.gather(*(self._snmp_get(oid) for oid in oids))
+        return dict(zip(oids, values))
 
-    async def async_discover(self) -> None:
+    async def async_discover(self, first: bool = False) -> None:
         # dynamic discovery of present OIDs / indices
         new_sensors: List[Dict[str, Any]] = []
         new_switches: List[Dict[str, Any]] = []
 
         # ---- SDM220 ---- (prefix 14.11.3.1)
+        # key: (oid, unit, scale to unit, ttl seconds, tier); ttl 0 reads the OID on every poll of its tier
         sdm = {
-            "energy_total": (".1.3.6.1.4.1.45797.14.11.3.1.7.1", "kWh", "div100"),
-            "power_W":      (".1.3.6.1.4.1.45797.14.11.3.1.9.1", "W",   "kW_div100_to_W"),
-            "voltage":      (".1.3.6.1.4.1.45797.14.11.3.1.14.1", "V", "div100"),
-            "current":      (".1.3.6.1.4.1.45797.14.11.3.1.39.1", "A", "div100"),
+            "energy_total": (".1.3.6.1.4.1.45797.14.11.3.1.7.1", "kWh", 0.01, ENERGY_TTL, TIER_SLOW),
+            "power_W":      (".1.3.6.1.4.1.45797.14.11.3.1.9.1", "W",   10.0, 0, TIER_FAST),  # orig kW = /100
+            "voltage":      (".1.3.6.1.4.1.45797.14.11.3.1.14.1", "V", 0.01, 0, TIER_FAST),
+            "current":      (".1.3.6.1.4.1.45797.14.11.3.1.39.1", "A", 0.01, 0, TIER_FAST),
         }
-        for key,(oid,unit,tf) in sdm.items():
-            val = await asyncio.to_thread(_snmp_get, self.host, self.read_com, oid)
-            if val is not None:
-                new_sensors.append({
-                    "unique_id": f"sdm220_{key}",
-                    "name": f"sdm220_{key}",
-                    "oid": oid, "unit": unit, "tf": tf
-                })
 
         # ---- DDS ---- (prefix 14.21.3.1)
         dds = {
-            "energy_total": (".1.3.6.1.4.1.45797.14.21.3.1.7.1", "kWh", "div100"),
-            "power_W":      (".1.3.6.1.4.1.45797.14.21.3.1.9.1", "W",   "kW_div1000_to_W"),  # orig kW = /1000
-            "voltage":      (".1.3.6.1.4.1.45797.14.21.3.1.15.1", "V", "div100"),
-            "current":      (".1.3.6.1.4.1.45797.14.21.3.1.14.1", "A", "div1000"),
+            "energy_total": (".1.3.6.1.4.1.45797.14.21.3.1.7.1", "kWh", 0.01, ENERGY_TTL, TIER_SLOW),
+            "power_W":      (".1.3.6.1.4.1.45797.14.21.3.1.9.1", "W",   1.0, 0, TIER_FAST),  # orig kW = /1000
+            "voltage":      (".1.3.6.1.4.1.45797.14.21.3.1.15.1", "V", 0.01, 0, TIER_FAST),
+            "current":      (".1.3.6.1.4.1.45797.14.21.3.1.14.1", "A", 0.001, 0, TIER_FAST),
         }
-        for key,(oid,unit,tf) in dds.items():
-            val = await asyncio.to_thread(_snmp_get, self.host, self.read_com, oid)
-            if val is not None:
-                new_sensors.append({
-                    "unique_id": f"dds_{key}",
-                    "name": f"dds_{key}",
-                    "oid": oid, "unit": unit, "tf": tf
-                })
 
-        # ---- Battery cells ---- (prefix 14.9.5.1 .x.{n})
-        # Probe up to 32 cells
-        for n in range(1, 33):
-            soc_oid = f".1.3.6.1.4.1.45797.14.9.5.1.11.{n}"
-            soc = await asyncio.to_thread(_snmp_get, self.host, self.read_com, soc_oid)
-            if soc is None:
-                continue  # cell not present
+        # ---- Battery cells ---- (prefix 14.9.5.1 .x.{n}), rows listed by a GETBULK on SOC (.11)
+        soc_column = f"{CELL_TABLE}11"
+
+        # ---- Attomat switches (prefix 14.18.3.1.3.{idx}) ----
+        attomat_oids = {idx: f".1.3.6.1.4.1.45797.14.18.3.1.3.{idx}" for idx in range(1, 9)}
+
+        # first pass: probe every scalar candidate and walk the SOC column at once
+        candidates = [oid for oid, _, _, _, _ in sdm.values()]
+        candidates += [oid for oid, _, _, _, _ in dds.values()]
+        candidates += list(attomat_oids.values())
+        found, soc_rows = await asyncio.gather(self._probe(candidates), self._snmp_bulk(soc_column))
+        soc_rows = soc_rows or {}
+
+        for prefix, table in (("sdm220", sdm), ("dds", dds)):
+            for key, (oid, unit, scale, ttl, tier) in table.items():
+                if found.get(oid) is not None:
+                    new_sensors.append({
+                        "unique_id": f"{prefix}_{key}",
+                        "name": f"{prefix}_{key}",
+                        "oid": oid, "unit": unit, "scale": scale, "ttl": ttl, "tier": tier
+                    })
+
+        # second pass: walk the remaining columns, kept only for cells whose SOC answered
+        cells = sorted(int(oid.rsplit(".", 1)[1]) for oid, raw in soc_rows.items() if raw is not None)
+        cell_columns = {
+            "voltage":     ("3", "V", 0.01, 0, TIER_FAST),
+            "current":     ("4", "A", 0.01, 0, TIER_FAST),
+            "temperature": ("7", "°C", 0.1, 0, TIER_SLOW),
+        }
+        if cells:
+            for part in await asyncio.gather(*(
+                self._snmp_bulk(f"{CELL_TABLE}{col}", cells[-1]) for col, _, _, _, _ in cell_columns.values()
+            )):
+                found.update(part or {})
+        for n in cells:
             new_sensors.append({
                 "unique_id": f"battery_cell_{n}_soc",
                 "name": f"battery_cell_{n}_soc",
-                "oid": soc_oid, "unit": "%", "tf": "div100"
-            })
-            volt_oid = f".1.3.6.1.4.1.45797.14.9.5.1.3.{n}"
-            curr_oid = f".1.3.6.1.4.1.45797.14.9.5.1.4.{n}"
-            temp_oid = f".1.3.6.1.4.1.45797.14.9.5.1.7.{n}"
-            new_sensors.append({
-                "unique_id": f"battery_cell_{n}_voltage",
-                "name": f"battery_cell_{n}_voltage",
-                "oid": volt_oid, "unit": "V", "tf": "div100"
-            })
-            new_sensors.append({
-                "unique_id": f"battery_cell_{n}_current",
-                "name": f"battery_cell_{n}_current",
-                "oid": curr_oid, "unit": "A", "tf": "div100"
-            })
-            new_sensors.append({
-                "unique_id": f"battery_cell_{n}_temperature",
-                "name": f"battery_cell_{n}_temperature",
-                "oid": temp_oid, "unit": "°C", "tf": "div10"
+                "oid": f"{soc_column}.{n}", "unit": "%", "scale": 0.01, "ttl": 0, "tier": TIER_SLOW
             })
+            for key, (col, unit, scale, ttl, tier) in cell_columns.items():
+                oid = f"{CELL_TABLE}{col}.{n}"
+                if found.get(oid) is None:
+                    continue
+                new_sensors.append({
+                    "unique_id": f"battery_cell_{n}_{key}",
+                    "name": f"battery_cell_{n}_{key}",
+                    "oid": oid, "unit": unit, "scale": scale, "ttl": ttl, "tier": tier
+                })
 
-        # ---- Attomat switches (prefix 14.18.3.1.3.{idx}) ----
-        for idx in range(1, 9):  # up to 8 channels
-            oid = f".1.3.6.1.4.1.45797.14.18.3.1.3.{idx}"
-            val = await asyncio.to_thread(_snmp_get, self.host, self.read_com, oid)
-            if val is None:
+        for idx, oid in attomat_oids.items():
+            if found.get(oid) is None:
                 continue
             new_switches.append({
                 "unique_id": f"attomat_{idx}",
@@ -158,49 +342,176 @@ class MatisHub:
             new_sensors.append({
                 "unique_id": f"attomat_{idx}_state",
                 "name": f"attomat_{idx}_state",
-                "oid": oid, "unit": None, "tf": "raw_int"
+                "oid": oid, "unit": None, "scale": 1.0, "ttl": 0, "tier": TIER_FAST
             })
 
         # Merge without duplicates
-        def _merge(old, new, key="unique_id"):
-            have = {e[key] for e in old}
-            for e in new:
-                if e[key] not in have:
-                    old.append(e)
+        for desc in new_sensors:
+            if desc["unique_id"] not in self._sensor_ids:
+                self._sensor_ids.add(desc["unique_id"])
+                desc["_varbind"] = (ObjectName(desc["oid"]), Null())
+                self.sensors.append(desc)
+                self._pending_new_sensors.append(desc)
+        for desc in new_switches:
+            if desc["unique_id"] not in self._switch_ids:
+                self._switch_ids.add(desc["unique_id"])
+                self.switches.append(desc)
+                self._pending_new_switches.append(desc)
+        self._rebuild_poll_plan()
+        self._flush_pending()
 
-        _merge(self.sensors, new_sensors)
-        _merge(self.switches, new_switches)
+        # inform coordinators to refresh soon; on setup the first refresh follows anyway
+        if not first:
+            for coordinator in self.coordinators.values():
+                await coordinator.async_request_refresh()
 
-        # inform coordinator to refresh soon
-        await self.coordinator.async_request_refresh()
+    def _rebuild_poll_plan(self) -> None:
+        self._uids = tuple(s["unique_id"] for s in self.sensors)
+        uid_slot = {uid: i for i, uid in enumerate(self._uids)}
+        oid_slots: Dict[str, List[int]] = {}
+        for i, s in enumerate(self.sensors):
+            oid_slots.setdefault(s["oid"], []).append(i)
+        self._oid_slots = oid_slots
 
-    async def _async_poll_all(self) -> Dict[str, Any]:
-        # pull values for all sensor OIDs
-        results = {}
-        tasks = []
-        loop = asyncio.get_running_loop()
-
-        async def fetch(oid: str):
-            v = await asyncio.to_thread(_snmp_get, self.host, self.read_com, oid)
-            results[oid] = v
+        # raw readings survive a rebuild so cached (still fresh) OIDs keep their value
+        raw_buffer = np.full(len(self._uids), np.nan)
+        for uid, i in self._uid_slot.items():
+            if uid in uid_slot:
+                raw_buffer[uid_slot[uid]] = self._raw_buffer[i]
+        self._uid_slot = uid_slot
+        self._scales = np.array([s["scale"] for s in self.sensors], dtype=np.float64)
+        self._raw_buffer = raw_buffer
+        self._out_buffer = raw_buffer * self._scales
 
+        # unique OIDs with their shortest ttl, so a shared OID is fetched once;
+        # an OID shared across tiers is polled by the fast one
+        oid_ttl: Dict[str, float] = {}
+        oid_tier: Dict[str, str] = {}
         for s in self.sensors:
-            tasks.append(fetch(s["oid"]))
-        if tasks:
-            await asyncio.gather(*tasks)
+            oid_ttl[s["oid"]] = min(oid_ttl.get(s["oid"], s["ttl"]), s["ttl"])
+            if oid_tier.get(s["oid"]) != TIER_FAST:
+                oid_tier[s["oid"]] = s["tier"]
 
-        # transform stage
-        for s in self.sensors:
-            raw = results.get(s["oid"])
-            tf = TRANSFORMS.get(s["tf"], lambda x: x)
-            try:
-                self._values[s["unique_id"]] = tf(raw)
-            except Exception:
-                self._values[s["unique_id"]] = None
-        return self._values
+        # group OIDs: cell table columns go via GETBULK, the rest in one GET
+        scalars: List[str] = []
+        columns: Dict[str, int] = {}
+        for oid in oid_ttl:
+            if oid.startswith(CELL_TABLE):
+                column, index = oid.rsplit(".", 1)
+                columns[column] = max(columns.get(column, 0), int(index))
+            else:
+                scalars.append(oid)
+        tier_ttl: Dict[str, Dict[str, float]] = {TIER_FAST: {}, TIER_SLOW: {}}
+        for oid, ttl in oid_ttl.items():
+            tier_ttl[oid_tier[oid]][oid] = ttl
+        self._oid_ttl = tier_ttl
+        varbinds = {s["oid"]: s["_varbind"] for s in self.sensors}
+        for column in columns:
+            varbinds[column] = self._varbind(column)
+        self._varbinds = varbinds
+        self._scalar_oids = scalars
+        self._cell_columns = columns
+
+    async def _async_poll(self, tier: str) -> MatisValues:
+        # only this tier's OIDs whose ttl expired are fetched; the rest keep their cached raw value
+        coordinator = self.coordinators[tier]
+        oid_ttl = self._oid_ttl[tier]
+        # polls start one interval apart give or take dispatch jitter, so a ttl
+        # is treated as expired half an interval early
+        slack = coordinator.update_interval.total_seconds() / 2
+        now = time.monotonic()
+        due = set()
+        self._cache_lookups += len(oid_ttl)
+        for oid, ttl in oid_ttl.items():
+            if self._next_try.get(oid, 0.0) > now:
+                continue  # quarantined
+            last = self._last_fetch.get(oid)
+            if last is None or now - last >= ttl - slack:
+                due.add(oid)
+            else:
+                self._cache_hits += 1
+        due_columns = {oid.rsplit(".", 1)[0] for oid in due if oid.startswith(CELL_TABLE)}
+        scalars = [oid for oid in self._scalar_oids if oid in due]
+
+        # buffers are captured so a rediscovery mid-poll cannot shift slots under us
+        oid_slots = self._oid_slots
+        raw_buffer = self._raw_buffer
+        out_buffer = self._out_buffer
+        scales = self._scales
+        data = MatisValues(self._uid_slot, out_buffer)
+
+        # at most one GET plus one GETBULK per cell column; each is applied as it
+        # lands so a slow or timing-out PDU does not hold back the others.
+        # Every request carries the due OIDs it is expected to answer
+        async def _tagged(covered: List[str], request) -> Tuple[List[str], Any]:
+            return covered, await request
+
+        requests = [
+            _tagged([oid for oid in due if oid.rsplit(".", 1)[0] == column], self._snmp_bulk(column, rows))
+            for column, rows in self._cell_columns.items() if column in due_columns
+        ]
+        if scalars:
+            requests.append(_tagged(scalars, self._snmp_get_many(scalars)))
+        answered = set()
+        missing = set()
+        unreachable = 0
+        remaining = len(requests)
+        for next_part in asyncio.as_completed(requests):
+            covered, part = await next_part
+            remaining -= 1
+            if part is None:
+                unreachable += 1
+                continue
+            for oid, raw in part.items():
+                slots = oid_slots.get(oid)
+                if slots is None:
+                    continue  # bulk row we do not poll
+                try:
+                    value = float(raw)
+                except (TypeError, ValueError):
+                    value = np.nan
+                else:
+                    answered.add(oid)
+                    self._last_fetch[oid] = now
+                    self._fail_counts.pop(oid, None)
+                    self._next_try.pop(oid, None)
+                for i in slots:
+                    raw_buffer[i] = value
+            # absent or unparsable in a response that did arrive
+            missing.update(oid for oid in covered if oid not in answered)
+            np.multiply(raw_buffer, scales, out=out_buffer)
+            if remaining and coordinator.data is not None:
+                coordinator.async_update_listeners()
+
+        if requests and unreachable == len(requests):
+            # lets the coordinator mark entities unavailable / raise ConfigEntryNotReady
+            raise UpdateFailed(f"{self.host}: no response to any SNMP request")
+
+        for oid in due - answered:
+            for i in oid_slots[oid]:
+                raw_buffer[i] = np.nan
+
+        # only per-varbind absence counts towards backoff; a lost PDU is not the OID's fault
+        for oid in missing:
+            fails = self._fail_counts.get(oid, 0) + 1
+            self._fail_counts[oid] = fails
+            delay = min(300, 2 ** min(fails, 9))
+            self._next_try[oid] = now + delay
+            _LOGGER.debug("%s: %s missing from response (%d in a row), quarantined for %d s", self.host, oid, fails, delay)
+        np.multiply(raw_buffer, scales, out=out_buffer)
+        # becomes coordinator.data
+        return data
 
-    def get_value(self, unique_id: str):
-        return self._values.get(unique_id)
+    @property
+    def cache_hit_rate(self) -> Optional[float]:
+        # share of sensor reads served from cache since startup, in %
+        if not self._cache_lookups:
+            return None
+        return round(100.0 * self._cache_hits / self._cache_lookups, 1)
 
     async def async_set_switch(self, oid: str, state: bool) -> bool:
-        return await asyncio.to_thread(_snmp_set, self.host, self.write_com, oid, 1 if state else 0)
\ No newline at end of file
+        ok = await self._snmp_set(oid, 1 if state else 0)
+        if ok:
+            # make the next poll re-read the state instead of serving the cache
+            self._last_fetch.pop(oid, None)
+        return ok
\ No newline at end of file
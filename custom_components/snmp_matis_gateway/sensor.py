@@ -4,6 +4,7 @@ from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -13,31 +14,20 @@ from .hub import MatisHub
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     hub: MatisHub = hass.data[DOMAIN][entry.entry_id]
 
-    # Create initial entities
-    entities = [MatisSensor(hub, s) for s in hub.sensors]
-    async_add_entities(entities)
+    async_add_entities([MatisCacheHitRateSensor(hub)])
 
-    # Dynamic add new discovered sensors on future rediscover
+    # hub hands over every sensor discovered so far, then later additions
     @callback
-    def _maybe_add_new_entities(_now=None):
-        new = []
-        current_ids = {e.unique_id for e in entities}
-        for s in hub.sensors:
-            if s["unique_id"] not in current_ids:
-                ent = MatisSensor(hub, s)
-                entities.append(ent)
-                new.append(ent)
-        if new:
-            async_add_entities(new)
-
-    # poll to detect if new ones appended by hub
-    hass.helpers.event.async_track_time_interval(_maybe_add_new_entities, hass.helpers.event.timedelta(seconds=15))
+    def _add_new_sensors(descs):
+        async_add_entities([MatisSensor(hub, s) for s in descs])
+
+    hub.set_new_sensor_callback(_add_new_sensors)
 
 class MatisSensor(CoordinatorEntity, SensorEntity):
     _attr_has_entity_name = True
 
     def __init__(self, hub: MatisHub, desc: dict):
-        super().__init__(hub.coordinator)
+        super().__init__(hub.coordinators[desc["tier"]])
         self.hub = hub
         self._desc = desc
         self._attr_unique_id = desc["unique_id"]
@@ -46,4 +36,19 @@ class MatisSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self):
-        return self.hub.get_value(self._desc["unique_id"])
\ No newline at end of file
+        return self.coordinator.data.get(self._desc["unique_id"])
+
+class MatisCacheHitRateSensor(CoordinatorEntity, SensorEntity):
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = PERCENTAGE
+
+    def __init__(self, hub: MatisHub):
+        super().__init__(hub.coordinator)
+        self.hub = hub
+        self._attr_unique_id = "poll_cache_hit_rate"
+        self._attr_name = "poll_cache_hit_rate"
+
+    @property
+    def native_value(self):
+        return self.hub.cache_hit_rate
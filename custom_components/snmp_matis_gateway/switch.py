@@ -4,6 +4,7 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .hub import MatisHub
@@ -11,50 +12,45 @@ from .hub import MatisHub
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     hub: MatisHub = hass.data[DOMAIN][entry.entry_id]
 
-    entities = [MatisSwitch(hub, s) for s in hub.switches]
-    async_add_entities(entities)
-
+    # hub hands over every switch discovered so far, then later additions
     @callback
-    def _maybe_add_new_switches(_now=None):
-        new = []
-        current_ids = {e.unique_id for e in entities}
-        for s in hub.switches:
-            if s["unique_id"] not in current_ids:
-                ent = MatisSwitch(hub, s)
-                entities.append(ent)
-                new.append(ent)
-        if new:
-            async_add_entities(new)
-
-    hass.helpers.event.async_track_time_interval(_maybe_add_new_switches, hass.helpers.event.timedelta(seconds=15))
-
-class MatisSwitch(SwitchEntity):
+    def _add_new_switches(descs):
+        async_add_entities([MatisSwitch(hub, s) for s in descs])
+
+    hub.set_new_switch_callback(_add_new_switches)
+
+class MatisSwitch(CoordinatorEntity, SwitchEntity):
     _attr_has_entity_name = True
 
     def __init__(self, hub: MatisHub, desc: dict):
+        super().__init__(hub.coordinator)
         self.hub = hub
         self._desc = desc
-        self._state = None
+        # value of the matching attomat_{idx}_state sensor (0/1)
+        self._state_uid = f"{desc['unique_id']}_state"
         self._attr_unique_id = desc["unique_id"]
         self._attr_name = desc["name"]
+        self._attr_is_on = self._read_state()
 
-    @property
-    def is_on(self) -> bool | None:
-        # state sensor value if present (0/1)
-        key = f"{self._desc['unique_id']}_state"
-        base = self.hub.get_value(key)
-        if base is None:
-            # fall back to reading switch oid value via value cache of state sensor with same oid
-            base = self.hub.get_value(self._desc["unique_id"])
-        if base is None:
-            return None
-        try:
-            return float(base) == 1.0
-        except Exception:
+    def _read_state(self) -> bool | None:
+        if self.coordinator.data is None:
             return None
+        v = self.coordinator.data.get(self._state_uid)
+        return None if v is None else v == 1.0
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._attr_is_on = self._read_state()
+        super()._handle_coordinator_update()
 
     async def async_turn_on(self, **kwargs):
-        await self.hub.async_set_switch(self._desc["oid"], True)
+        if await self.hub.async_set_switch(self._desc["oid"], True):
+            self._attr_is_on = True
+            self.async_write_ha_state()
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs):
-        await self.hub.async_set_switch(self._desc["oid"], False)
\ No newline at end of file
+        if await self.hub.async_set_switch(self._desc["oid"], False):
+            self._attr_is_on = False
+            self.async_write_ha_state()
+        await self.coordinator.async_request_refresh()